@@ -6,7 +6,10 @@ from .kanjize import (
     KanjizeConfiguration,
     KanjizeZero,
     KanjizeStyle,
+    canonicalize,
+    canonicalize_many,
 )
+from .aio import aiter_kanji2number_lines, aiter_kanji2number_spans
 
 __all__ = [
     "__version__",
@@ -16,4 +19,8 @@ __all__ = [
     "KanjizeConfiguration",
     "KanjizeZero",
     "KanjizeStyle",
+    "canonicalize",
+    "canonicalize_many",
+    "aiter_kanji2number_lines",
+    "aiter_kanji2number_spans",
 ]
@@ -0,0 +1,232 @@
+import asyncio
+import codecs
+import re
+from concurrent.futures import Executor
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .kanjize import default_unit_dict
+from .kanjize import kanji2number
+from .kanjize import little_units
+from .kanjize import number2kanji
+from .kanjize import number_dict
+
+Chunk = Union[bytes, bytearray, memoryview, str]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_multi_units = sorted((u for u in default_unit_dict if len(u) > 1), key=len, reverse=True)
+_single_units = "".join(u for u in default_unit_dict if len(u) == 1)
+_span_digit = r"[\d{}]".format("".join(number_dict))
+# "." is a part of a span only if it is between digits, so a period after a number is not
+_span_body = r"(?:{}|{d}|(?<={d})\.(?={d})|[{}{}])".format(
+    "|".join(_multi_units), little_units, _single_units, d=_span_digit
+)
+span_regex = re.compile(rf"[-－⁻+＋⁺₊]?{_span_body}+")
+_span_continuation_regex = re.compile(f"{_span_body}*")
+# a multi letter unit may be cut by a chunk boundary, so this many letters are kept until more text arrives
+_span_holdback = max(map(len, default_unit_dict)) - 1
+# length of the longest canonical rendering, "-九千九百九十九無量大数...九千九百九十九". this is a deliberate cutoff:
+# kanji2number can parse some longer notations (e.g. with leading zeros), but longer spans are skipped and longer
+# lines are rejected so that no more than this is kept between chunks
+max_span_length = len(number2kanji(-(10 ** 72 - 1)))
+
+
+class _LineScanner:
+    """Internal class. Splits incrementally fed text into lines and converts each line.
+
+    A line longer than `max_span_length` letters raises ValueError as soon as it is found to be so long,
+    so the unfinished line kept between feeds is never longer than that.
+    """
+
+    def __init__(self):
+        # the unfinished line without leading whitespace. trailing whitespace is kept as one letter
+        self.line = ""
+
+    def feed(self, text: str, final: bool = False) -> List[int]:
+        *lines, rest = text.split("\n")
+        if lines:
+            lines[0] = self.line + lines[0]
+            self.line = ""
+        self.line = self._trim(self.line + rest)
+        if final:
+            lines.append(self.line)
+            self.line = ""
+        lines = [self._trim(line).rstrip() for line in lines]
+        return [kanji2number(line) for line in lines if line]
+
+    @staticmethod
+    def _trim(line: str) -> str:
+        line = line.lstrip()
+        stripped = line.rstrip()
+        if len(stripped) > max_span_length:
+            raise ValueError(
+                f"Kanji `{stripped[:max_span_length]}...` seems to be invalid. It is longer than {max_span_length} letters."
+            )
+        return stripped + line[len(stripped):len(stripped) + 1]
+
+
+class _SpanScanner:
+    """Internal class. Finds numeral spans in incrementally fed text and converts each span.
+
+    At most one unfinished span (up to `max_span_length` letters) and a few following letters are kept
+    between feeds, and only the new text is matched against it, so each feed takes time linear in its text.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        # length of the unfinished span at the head of buffer, or None if there is no such span
+        self.matched: Optional[int] = None
+        # whether the unfinished span is too long and will be skipped
+        self.skipping = False
+
+    def feed(self, text: str, final: bool = False) -> List[Tuple[str, int]]:
+        buffer = self.buffer + text
+        limit = len(buffer) if final else len(buffer) - _span_holdback
+        result = []
+        pos = 0
+
+        if self.matched is not None:
+            end = _span_continuation_regex.match(buffer, self.matched).end()
+            if end >= limit and not final:
+                self._hold(buffer, 0, end)
+                return result
+            if not self.skipping and end <= max_span_length:
+                self._convert(buffer[:end], result)
+            pos = end
+            self.matched = None
+            self.skipping = False
+
+        for match in span_regex.finditer(buffer, pos):
+            if match.end() >= limit and not final:
+                # this span may continue in the next chunk
+                self._hold(buffer, match.start(), match.end())
+                return result
+            if match.end() - match.start() <= max_span_length:
+                self._convert(match.group(), result)
+
+        self.buffer = buffer[max(limit, pos):]
+        self.matched = None
+        self.skipping = False
+        return result
+
+    def _hold(self, buffer: str, start: int, end: int):
+        if self.skipping or end - start > max_span_length:
+            # the last letter is kept for the lookbehind of "."
+            keep_from = max(end - 1, 0)
+            self.buffer = buffer[keep_from:]
+            self.matched = end - keep_from
+            self.skipping = True
+        else:
+            self.buffer = buffer[start:]
+            self.matched = end - start
+
+    @staticmethod
+    def _convert(span: str, result: List[Tuple[str, int]]):
+        try:
+            result.append((span, kanji2number(span)))
+        except ValueError:
+            pass
+
+
+async def _iter_converted(
+        source: Union[AsyncIterable[Chunk], Any],
+        scanner: Union[_LineScanner, _SpanScanner],
+        encoding: str,
+        errors: str,
+        chunk_size: int,
+        offload: bool,
+        executor: Optional[Executor],
+) -> AsyncIterator[Any]:
+    """Internal function. Reads `source` chunk by chunk, feeds decoded text to `scanner` and yields its results.
+
+    The next chunk is not read until every result of the previous one has been consumed.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    loop = asyncio.get_running_loop()
+
+    def process(chunk: Chunk, final: bool = False):
+        text = chunk if isinstance(chunk, str) else decoder.decode(chunk, final)
+        return scanner.feed(text, final)
+
+    async def chunks() -> AsyncIterator[Chunk]:
+        if hasattr(source, "read"):  # asyncio.StreamReader and the like
+            while True:
+                chunk = await source.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            async for chunk in source:
+                yield chunk
+
+    async for chunk in chunks():
+        if offload:
+            for converted in await loop.run_in_executor(executor, process, chunk):
+                yield converted
+            continue
+        if isinstance(chunk, memoryview):
+            chunk = chunk.tobytes()
+        for start in range(0, len(chunk), chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            for converted in process(chunk[start:start + chunk_size]):
+                yield converted
+    if offload:
+        rest = await loop.run_in_executor(executor, process, b"", True)
+    else:
+        rest = process(b"", final=True)
+    for converted in rest:
+        yield converted
+
+
+def aiter_kanji2number_lines(
+        source: Union[AsyncIterable[Chunk], Any],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offload: bool = False,
+        executor: Optional[Executor] = None,
+) -> AsyncIterator[int]:
+    """
+    Asynchronously converts each line of a byte or text stream with `kanji2number`. Blank lines are skipped.
+    Leading and trailing whitespace of each line is ignored.
+
+    :param source: `asyncio.StreamReader` (or any object with `async read(n)`) or async iterable of bytes / str chunks
+    :param encoding: Encoding used to decode byte chunks incrementally
+    :param errors: Error handling scheme of the decoder
+    :param chunk_size: Size of each read, and the largest slice processed without giving control back to the event loop
+    :param offload: Whether every chunk is processed in `executor` instead of on the event loop
+    :param executor: Executor used if `offload` is True. `None` means the default executor of the running loop
+    :return: async iterator of int
+    :raises ValueError: if a line is invalid as number or longer than `max_span_length` letters
+    """
+    return _iter_converted(source, _LineScanner(), encoding, errors, chunk_size, offload, executor)
+
+
+def aiter_kanji2number_spans(
+        source: Union[AsyncIterable[Chunk], Any],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offload: bool = False,
+        executor: Optional[Executor] = None,
+) -> AsyncIterator[Tuple[str, int]]:
+    """
+    Asynchronously extracts numerals from a byte or text stream and converts them with `kanji2number`.
+    Spans which `kanji2number` can not parse and spans longer than `max_span_length` letters are skipped.
+
+    :param source: `asyncio.StreamReader` (or any object with `async read(n)`) or async iterable of bytes / str chunks
+    :param encoding: Encoding used to decode byte chunks incrementally
+    :param errors: Error handling scheme of the decoder
+    :param chunk_size: Size of each read, and the largest slice processed without giving control back to the event loop
+    :param offload: Whether every chunk is processed in `executor` instead of on the event loop
+    :param executor: Executor used if `offload` is True. `None` means the default executor of the running loop
+    :return: async iterator of tuple (span, value)
+    """
+    return _iter_converted(source, _SpanScanner(), encoding, errors, chunk_size, offload, executor)
@@ -2,8 +2,12 @@ import enum
 import math
 import re
 from dataclasses import dataclass
+from fractions import Fraction
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
+from typing import Iterable
+from typing import List
 from typing import Optional
 
 
@@ -51,6 +55,33 @@ REVERSED_DIGITS = KanjiType(
     {v: k for k, v in DIGITS.daiji.items()},
     {v: k for k, v in DIGITS.shoji.items()},
 )
+# shared by every configuration, so these are read-only
+LITTLE_UNIT_BY_VALUE = KanjiType(
+    MappingProxyType({10: "拾", 100: "佰", 1000: "阡", 10000: "萬"}),
+    MappingProxyType({10: "十", 100: "百", 1000: "千", 10000: "万"}),
+)
+_large_units = {
+    "億": 8,
+    "兆": 12,
+    "京": 16,
+    "垓": 20,
+    "𥝱": 24,
+    "穣": 28,
+    "溝": 32,
+    "澗": 36,
+    "正": 40,
+    "載": 44,
+    "極": 48,
+    "恒河沙": 52,
+    "阿僧祇": 56,
+    "那由多": 60,
+    "不可思議": 64,
+    "無量大数": 68,
+}
+UNIT_DICT = KanjiType(
+    MappingProxyType({"萬": 4, **_large_units}),
+    MappingProxyType({"万": 4, **_large_units}),
+)
 
 
 class KanjizeZero(enum.Enum):
@@ -91,31 +122,11 @@ class KanjizeConfiguration:
 
     @property
     def little_unit_by_value(self):
-        if self.use_daiji:
-            return {10: "拾", 100: "佰", 1000: "阡", 10000: "萬"}
-        return {10: "十", 100: "百", 1000: "千", 10000: "万"}
+        return LITTLE_UNIT_BY_VALUE.daiji if self.use_daiji else LITTLE_UNIT_BY_VALUE.shoji
 
     @property
     def unit_dict(self):
-        return {
-            "萬" if self.use_daiji else "万": 4,
-            "億": 8,
-            "兆": 12,
-            "京": 16,
-            "垓": 20,
-            "𥝱": 24,
-            "穣": 28,
-            "溝": 32,
-            "澗": 36,
-            "正": 40,
-            "載": 44,
-            "極": 48,
-            "恒河沙": 52,
-            "阿僧祇": 56,
-            "那由多": 60,
-            "不可思議": 64,
-            "無量大数": 68,
-        }
+        return UNIT_DICT.daiji if self.use_daiji else UNIT_DICT.shoji
 
     @property
     def zero(self) -> str:
@@ -140,6 +151,56 @@ class KanjizeConfiguration:
             | {"0": zero}
         )
 
+    @property
+    def canonical_regex(self):
+        """Regex which fully matches exactly the strings `number2kanji` returns with this configuration."""
+        return self._build_canonical_regex(
+            self.style, self.use_daiji, self.zero, self.kanji_thousand
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _build_canonical_regex(
+            cls, style: KanjizeStyle, use_daiji: bool, zero: str, kanji_thousand: bool
+    ):
+        digits = REVERSED_DIGITS.daiji if use_daiji else REVERSED_DIGITS.shoji
+        little_units = LITTLE_UNIT_BY_VALUE.daiji if use_daiji else LITTLE_UNIT_BY_VALUE.shoji
+        units = UNIT_DICT.daiji if use_daiji else UNIT_DICT.shoji
+        non_zero = "[{}]".format("".join(digits.values()))
+
+        if style is KanjizeStyle.FLAT:
+            return re.compile(
+                "{}|-?{}[{}{}]*".format(
+                    re.escape(zero), non_zero, "".join(digits.values()), re.escape(zero)
+                )
+            )
+
+        if style is KanjizeStyle.ALL:
+            # "一" is omitted before 千, 百 and 十
+            multiplier = "[{}]?".format("".join(v for k, v in digits.items() if k > 1))
+            # lookahead prevents the group from being empty
+            group = "(?=[{}{}])(?:{m}{})?(?:{m}{})?(?:{m}{})?{}?".format(
+                "".join(digits.values()),
+                "".join(little_units[value] for value in (1000, 100, 10)),
+                *(little_units[value] for value in (1000, 100, 10)),
+                non_zero,
+                m=multiplier,
+            )
+        elif kanji_thousand:
+            group = f"(?:[1-9]{little_units[1000]}|[1-9](?!000)[0-9]{{3}}|[1-9][0-9]{{0,2}})"
+        else:
+            group = "[1-9][0-9]{0,3}"
+
+        # a unit must not be followed by the same or larger unit
+        ordered_units = sorted(units, key=units.get, reverse=True)
+        unit = "|".join(
+            "{}(?!.*(?:{}))".format(re.escape(u), "|".join(ordered_units[: i + 1]))
+            for i, u in enumerate(ordered_units)
+        )
+        return re.compile(
+            "{}|(?!-?$)-?(?:{}(?:{}))*(?:{})?".format(re.escape(zero), group, unit, group)
+        )
+
 
 _default_config = KanjizeConfiguration()
 
@@ -214,6 +275,17 @@ def kanji2number(kanjis: str) -> int:
     :param kanjis: Kanji str to convert into Integer
     :return: int
     """
+    return _signed_kanji2number(kanjis)
+
+
+def _signed_kanji2number(kanjis: str, exact: bool = False) -> int:
+    """Internal function. Converts kanji str with sign to the number.
+
+    :param kanjis: Kanji str to convert into Integer
+    :param exact: Whether decimals are calculated exactly and non-integer value raises ValueError
+    :return: int
+    :raises ValueError: if the value of kanjis is invalid as number
+    """
     if not kanjis:
         raise ValueError("Kanji is empty")
 
@@ -224,23 +296,28 @@ def kanji2number(kanjis: str) -> int:
     is_negative = kanjis[0] in "-－⁻"
     if is_negative or kanjis[0] in "+＋⁺₊+":
         kanjis = kanjis[1:]
-    result = _kanji2number(given, kanjis)
+    result = _kanji2number(given, kanjis, exact)
     return result * -1 if is_negative else result
 
 
+default_unit_dict = _default_config.unit_dict
+# units kanji2number accepts. daiji "萬" is the same unit as "万"
+parser_unit_dict = MappingProxyType({**UNIT_DICT.daiji, **UNIT_DICT.shoji})
 short_regex = re.compile(
-    r"(?:(.*?)({}))?(.*)".format("|".join(_default_config.unit_dict.keys()))
+    r"(?:(.*?)({}))?(.*)".format("|".join(parser_unit_dict.keys()))
 )
-default_unit_dict = _default_config.unit_dict
 unit_regex = re.compile("|".join(default_unit_dict.keys()))
+# number2kanji can not convert numbers this large unless style is `KanjizeStyle.FLAT`
+number_limit = 10 ** (max(default_unit_dict.values()) + 4)
 
 
-def _kanji2number(given: str, kanjis: str) -> int:
+def _kanji2number(given: str, kanjis: str, exact: bool = False) -> int:
     """Internal function. Converts kanji str without sign to the number.
     This calls itself recursively.
 
     :param given: Original kanji str to be converted finally
     :param kanjis: Kanji str to be converted
+    :param exact: Whether decimals are calculated exactly and non-integer value raises ValueError
     :return: the value of kanjis and the name of the most significant unit
     :rtype: int
     :raises ValueError: if the value of kanjis is invalid as number
@@ -260,22 +337,22 @@ def _kanji2number(given: str, kanjis: str) -> int:
         if (
                 min_unit
                 and left_unit
-                and default_unit_dict[min_unit] <= default_unit_dict[left_unit]
+                and parser_unit_dict[min_unit] <= parser_unit_dict[left_unit]
         ):
             raise ValueError(
                 f"Kanji `{given}` seems to be invalid. `{min_unit}` is followed by too large unit `{left_unit}`."
             )
 
         if left_val or left_unit:
-            base_unit = default_unit_dict[left_unit] if left_unit else 0
-            fragment_value = parse_short(left_val, base_unit)
+            base_unit = parser_unit_dict[left_unit] if left_unit else 0
+            fragment_value = parse_short(left_val, base_unit, exact)
         elif kanjis:
-            fragment_value = parse_short(kanjis)
+            fragment_value = parse_short(kanjis, exact=exact)
             kanjis = ""
         else:
             break
 
-        if min_unit and fragment_value >= 10 ** default_unit_dict[min_unit]:
+        if min_unit and fragment_value >= 10 ** parser_unit_dict[min_unit]:
             raise ValueError(
                 f"Kanji `{given}` seems to be invalid. `{left_unit}` is followed by too large number `{left_val}`."
             )
@@ -320,10 +397,11 @@ short_parser_regex = re.compile(
 )
 
 
-def parse_short(kanji: Optional[str], base_unit: int = 0) -> int:
+def parse_short(kanji: Optional[str], base_unit: int = 0, exact: bool = False) -> int:
     """
     :param kanji: Kanji str to convert into Integer
     :param base_unit: multiply by 10 ** base_unit
+    :param exact: Whether decimals are calculated exactly and non-integer value raises ValueError
     :return: int
     """
     if not kanji:
@@ -342,7 +420,9 @@ def parse_short(kanji: Optional[str], base_unit: int = 0) -> int:
             v = 1
         else:
             try:
-                v = (float if "." in v else int)(v.translate(number_dict_table))
+                v = (
+                    (Fraction if exact else float) if "." in v else int
+                )(v.translate(number_dict_table))
             except ValueError:
                 raise ValueError(f"Kanji `{kanji}` seems to be invalid.")
 
@@ -354,7 +434,99 @@ def parse_short(kanji: Optional[str], base_unit: int = 0) -> int:
 
         result += v * unit
 
-    return int(result * 10 ** base_unit)
+    result *= 10 ** base_unit
+    if exact and result != int(result):
+        raise ValueError(f"Kanji `{kanji}` seems to be invalid. It is not an integer.")
+    return int(result)
+
+
+def canonicalize(kanjis: str, config: KanjizeConfiguration = _default_config) -> str:
+    """
+    Converts any notation of a number into the one `number2kanji` returns with `config`,
+    so that "五千八百七万六千九十九", "5807万6099" and "58076099" give the same str.
+    If kanjis is already in that notation, it is returned as is without being converted.
+
+    :param kanjis: Kanji str to canonicalize
+    :param config: KanjizeConfiguration
+    :return: str
+    :raises ValueError: if the value of kanjis is invalid as number, is not an integer
+        or is too large to be converted with `config`
+    """
+    if config.canonical_regex.fullmatch(kanjis):
+        return kanjis
+    value = _signed_kanji2number(kanjis, exact=True)
+    if config.style is not KanjizeStyle.FLAT and abs(value) >= number_limit:
+        raise ValueError(f"Kanji `{kanjis}` seems to be invalid. It must be less than 10 ** 72 in absolute value.")
+    return number2kanji(value, config=config)
+
+
+def canonicalize_many(
+        kanjis: Iterable[str], config: KanjizeConfiguration = _default_config
+) -> List[str]:
+    """
+    Batch version of `canonicalize`. Each distinct str is converted only once.
+
+    :param kanjis: Kanji strs to canonicalize
+    :param config: KanjizeConfiguration
+    :return: list of str in the same order as kanjis
+    :raises ValueError: if any of kanjis can not be canonicalized
+    """
+    cache = {}
+    result = []
+    for k in kanjis:
+        canonical = cache.get(k)
+        if canonical is None:
+            canonical = cache[k] = canonicalize(k, config=config)
+        result.append(canonical)
+    return result
+
+
+format_spec_prefix = "kanji"
+_format_spec_bools = {"true": True, "false": False}
+
+
+@lru_cache(maxsize=None)
+def _parse_format_spec(spec: str) -> KanjizeConfiguration:
+    """
+    Internal function. Parses format spec like "kanji:mixed,daiji,zero=sign" into KanjizeConfiguration.
+    Options are separated by "," and each of them is one of
+    `style=all|mixed|flat`, `zero=kanji|sign`, `daiji=true|false`, `kanji_thousand=true|false`,
+    a bare style name (`mixed`) or a bare boolean option name (`daiji`) meaning true.
+    Options are case-insensitive.
+    The result is cached and shared, so each distinct spec is parsed only once. It must not be modified.
+
+    :param spec: format spec starting with "kanji"
+    :return: KanjizeConfiguration
+    :raises ValueError: if spec is invalid
+    """
+    prefix, _, options = spec.partition(":")
+    if prefix != format_spec_prefix:
+        raise ValueError(f"Format spec `{spec}` seems to be invalid. It must start with `{format_spec_prefix}`.")
+
+    kwargs = {}
+    for option in filter(None, options.split(",")):
+        key, has_value, value = (s.strip() for s in option.lower().partition("="))
+        if not has_value:
+            if key in {s.value for s in KanjizeStyle}:
+                key, value = "style", key
+            else:
+                value = "true"
+
+        if key not in ("style", "zero", "daiji", "kanji_thousand"):
+            raise ValueError(f"Format spec `{spec}` seems to be invalid. Unknown option `{key}`.")
+        key = "use_daiji" if key == "daiji" else key
+        if key in kwargs:
+            raise ValueError(f"Format spec `{spec}` seems to be invalid. `{option}` conflicts with another option.")
+        try:
+            if key == "style":
+                kwargs[key] = KanjizeStyle(value)
+            elif key == "zero":
+                kwargs[key] = KanjizeZero[value.upper()]
+            else:
+                kwargs[key] = _format_spec_bools[value]
+        except (KeyError, ValueError):
+            raise ValueError(f"Format spec `{spec}` seems to be invalid. Invalid option `{option}`.")
+    return KanjizeConfiguration(**kwargs)
 
 
 class Number(int):
@@ -406,3 +578,11 @@ class Number(int):
 
     def __repr__(self):
         return f"Number<{int(self)}>"
+
+    def __format__(self, format_spec: str) -> str:
+        """Formats as Kanji if format_spec starts with "kanji" like f"{n:kanji:mixed,daiji,zero=sign}".
+        See `_parse_format_spec` for the options. Otherwise, this works the same as int.
+        """
+        if format_spec.startswith(format_spec_prefix):
+            return number2kanji(int(self), config=_parse_format_spec(format_spec))
+        return int.__format__(self, format_spec)
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kanjize import aiter_kanji2number_lines, aiter_kanji2number_spans
+from kanjize.aio import _LineScanner, _SpanScanner, max_span_length
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(iterator):
+    return [v async for v in iterator]
+
+
+def _stream_reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestAio:
+    """
+    test class of kanjize.aio
+    """
+
+    def test_lines(self):
+        data = "五千八百七万六千九十九\r\n\n伍阡捌佰漆万陸阡玖拾玖\n5807万6099\n-1.5億".encode()
+
+        async def run(**kwargs):
+            return await _collect(aiter_kanji2number_lines(_stream_reader(data), **kwargs))
+
+        expected = [5807_6099, 5807_6099, 5807_6099, -1_5000_0000]
+        assert expected == asyncio.run(run())
+        # multibyte letters are split across reads
+        assert expected == asyncio.run(run(chunk_size=1))
+        assert expected == asyncio.run(run(chunk_size=5, offload=True))
+
+        with pytest.raises(ValueError):
+            asyncio.run(_collect(aiter_kanji2number_lines(_chunks("1\n", "万1\n"))))
+
+    def test_lines_long_line(self):
+        # a line longer than any number raises ValueError without being kept as a whole
+        scanner = _LineScanner()
+        with pytest.raises(ValueError):
+            for i in range(0, 400_000, 64):
+                scanner.feed("1" * 64)
+                assert len(scanner.line) <= max_span_length + 1
+        with pytest.raises(ValueError):
+            asyncio.run(_collect(aiter_kanji2number_lines(_chunks("1\n", "2" * 2_000_000, "\n3\n"))))
+
+        # surrounding whitespace does not count
+        longest = "-" + "9" * 71
+        padding = " " * 400_000
+        assert [-(10 ** 71 - 1), 1] == asyncio.run(
+            _collect(aiter_kanji2number_lines(_chunks(padding, longest, padding, "\n1")))
+        )
+
+    def test_offload(self):
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                self.submitted += 1
+                return super().submit(*args, **kwargs)
+
+        data = "五千八百七万六千九十九\n".encode() * 1000
+
+        async def run(executor, **kwargs):
+            return await _collect(
+                aiter_kanji2number_lines(_stream_reader(data), executor=executor, **kwargs)
+            )
+
+        with CountingExecutor(1) as executor:
+            assert [5807_6099] * 1000 == asyncio.run(run(executor, chunk_size=1024))
+            assert 0 == executor.submitted
+            assert [5807_6099] * 1000 == asyncio.run(run(executor, chunk_size=1024, offload=True))
+            # every chunk read from the stream and the final flush
+            assert len(data) // 1024 + 2 == executor.submitted
+
+    def test_spans(self):
+        text = "売上は5807万6099円、前年は二百十一億。正しい値は1恒河沙。"
+        expected = [("5807万6099", 5807_6099), ("二百十一億", 211_0000_0000), ("1恒河沙", 10 ** 52)]
+
+        async def run(chunks, **kwargs):
+            return await _collect(aiter_kanji2number_spans(_chunks(*chunks), **kwargs))
+
+        assert expected == asyncio.run(run([text]))
+        assert expected == asyncio.run(run(list(text)))
+        assert expected == asyncio.run(run([text.encode()[i:i + 3] for i in range(0, len(text.encode()), 3)]))
+        with ThreadPoolExecutor(1) as executor:
+            assert expected == asyncio.run(
+                run([text.encode()], chunk_size=4, offload=True, executor=executor)
+            )
+
+    def test_spans_period(self):
+        # "." is a decimal point only between digits
+        text = "価格は5万. 次は1.5億です。合計は5万."
+        expected = [("5万", 5_0000), ("1.5億", 1_5000_0000), ("5万", 5_0000)]
+        assert expected == asyncio.run(_collect(aiter_kanji2number_spans(_chunks(text))))
+        assert expected == asyncio.run(_collect(aiter_kanji2number_spans(_chunks(*text))))
+
+    def test_spans_long_run(self):
+        # a run longer than any number is skipped without being kept as a whole
+        run = "1" * 400_000
+        scanner = _SpanScanner()
+        result = []
+        for i in range(0, len(run), 64):
+            result += scanner.feed(run[i:i + 64])
+            assert len(scanner.buffer) <= max_span_length + 64
+        result += scanner.feed("、5万。", final=True)
+        assert [("5万", 5_0000)] == result
+
+        longest = "-" + "9" * 71
+        text = f"{run}、{longest}、{run}"
+        chunks = [text[i:i + 1000] for i in range(0, len(text), 1000)]
+        assert [(longest, -(10 ** 71 - 1))] == asyncio.run(
+            _collect(aiter_kanji2number_spans(_chunks(*chunks)))
+        )
@@ -7,6 +7,8 @@ from kanjize import (
     KanjizeConfiguration,
     KanjizeZero,
     KanjizeStyle,
+    canonicalize,
+    canonicalize_many,
 )
 
 
@@ -123,6 +125,13 @@ class TestKanjize:
         assert 1234 == kanji2number("阡二百三拾四")
         assert 601 == kanji2number("六〇一")
         assert 601 == kanji2number("六零一")
+        assert 5807_6099 == kanji2number("伍阡捌佰漆萬陸阡玖拾玖")
+        assert 5807_6099 == kanji2number("5807萬6099")
+        # error messages refer to the unit as given
+        with pytest.raises(ValueError, match="`萬` needs any leading number"):
+            kanji2number("萬")
+        with pytest.raises(ValueError, match="`萬` is followed by too large unit `万`"):
+            kanji2number("1萬1万")
 
     def test_number2kanji(self):
         assert number2kanji(1) == "一"
@@ -265,6 +274,98 @@ class TestKanjize:
         with pytest.raises(ZeroDivisionError):
             Number(2) / Number(0)
 
+    def test_number_format(self):
+        n = Number(5807_6099)
+        assert "五千八百七万六千九十九" == f"{n:kanji}"
+        assert "伍阡捌佰漆萬陸阡玖拾玖" == f"{n:kanji:daiji}"
+        assert "5807万6099" == f"{n:kanji:mixed}"
+        assert "5807万6099" == f"{n:kanji:style=mixed,daiji=false}"
+        assert "-1億5阡萬320" == f"{Number(-1_5000_0320):kanji:mixed,daiji}"
+        assert "-1億5000万320" == f"{Number(-1_5000_0320):kanji:mixed,kanji_thousand=false}"
+        assert "六〇一" == f"{Number(601):kanji:flat}"
+        assert "六零一" == f"{Number(601):kanji:flat,zero=kanji}"
+        assert "〇" == f"{Number(0):kanji:mixed,daiji,zero=sign}"
+        # options are case-insensitive
+        assert "5807万6099" == f"{n:kanji:Mixed}"
+        assert "5807萬6099" == f"{n:kanji:STYLE=MIXED,Daiji=True}"
+        assert "〇" == f"{Number(0):kanji:zero=SIGN}"
+        assert "58,076,099" == f"{n:,}"
+        assert "  58076099" == f"{n:>10}"
+
+        for spec in ("kanji:unknown", "kanji:style=wide", "kanji:zero=none",
+                     "kanji:daiji=yes", "kanji:mixed,flat", "kanjii"):
+            with pytest.raises(ValueError):
+                format(n, spec)
+
+    def test_configuration_tables(self):
+        for config in (KanjizeConfiguration(), KanjizeConfiguration(use_daiji=True)):
+            # tables are shared by every configuration and the parser, so they must not be modified
+            with pytest.raises(TypeError):
+                config.unit_dict["十"] = 1
+            with pytest.raises(TypeError):
+                config.little_unit_by_value[10] = "拾"
+        assert 5807_6099 == kanji2number("5807万6099")
+
+    def test_canonicalize(self):
+        for kanjis in ("五千八百七万六千九十九", "伍阡捌佰漆萬陸阡玖拾玖", "5807万6099", "58076099", "58百7万6千99"):
+            assert "五千八百七万六千九十九" == canonicalize(kanjis)
+            assert "5807万6099" == canonicalize(
+                kanjis, config=KanjizeConfiguration(KanjizeStyle.MIXED)
+            )
+            assert "伍阡捌佰漆萬陸阡玖拾玖" == canonicalize(
+                kanjis, config=KanjizeConfiguration(use_daiji=True)
+            )
+            assert "五八〇七六〇九九" == canonicalize(
+                kanjis, config=KanjizeConfiguration(KanjizeStyle.FLAT)
+            )
+        assert "零" == canonicalize("〇")
+        assert "千" == canonicalize("一千")
+        assert "-1億5千万" == canonicalize(
+            "-150000000", config=KanjizeConfiguration(KanjizeStyle.MIXED)
+        )
+        assert "1億5000万" == canonicalize(
+            "1億5千万",
+            config=KanjizeConfiguration(KanjizeStyle.MIXED, kanji_thousand=False),
+        )
+        with pytest.raises(ValueError):
+            canonicalize("万1千234")
+
+        # decimals are allowed only if the value is an integer
+        assert "一億五千二十五万三百二十" == canonicalize("1.5億250.32千")
+        assert "-一億五千万" == canonicalize("-1.5億")
+        for kanjis in ("1.5", "0.5", "一.五", "1.00005万", "-250.3205千"):
+            with pytest.raises(ValueError):
+                canonicalize(kanjis)
+        with pytest.raises(ValueError):
+            canonicalize_many(["1", "1.5"])
+
+        # number2kanji can not convert 10 ** 72 or more except for FLAT style
+        assert "千無量大数" == canonicalize("1" + "0" * 71)
+        for kanjis in ("1" + "0" * 72, "-1" + "0" * 73):
+            with pytest.raises(ValueError):
+                canonicalize(kanjis)
+            with pytest.raises(ValueError):
+                canonicalize(kanjis, config=KanjizeConfiguration(KanjizeStyle.MIXED))
+        assert "一" + "〇" * 72 == canonicalize(
+            "1" + "0" * 72, config=KanjizeConfiguration(KanjizeStyle.FLAT)
+        )
+
+        assert ["五千八百七万六千九十九", "五千八百七万六千九十九", "十", "零"] == canonicalize_many(
+            ["5807万6099", "五千八百七万六千九十九", "10", "0"]
+        )
+        for config in (
+                KanjizeConfiguration(style, zero, kanji_thousand, use_daiji)
+                for style in KanjizeStyle
+                for zero in KanjizeZero
+                for kanji_thousand in (True, False)
+                for use_daiji in (True, False)
+        ):
+            for number in (0, 1, 10, 1000, 1001, 5000_0000, -1_5000_0320, 10 ** 68):
+                kanjis = number2kanji(number, config=config)
+                assert config.canonical_regex.fullmatch(kanjis)
+                assert kanjis == canonicalize(kanjis, config=config)
+                assert number == kanji2number(kanjis)
+
 
 if __name__ == "__main__":
     pytest.main()